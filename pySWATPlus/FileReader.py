@@ -2,8 +2,24 @@ import pandas as pd
 import warnings
 import dask.dataframe as dd
 from pathlib import Path
-from typing import Union, List, Dict, Literal, Optional
+from typing import Union, List, Dict, Literal, Optional, Tuple
 import os
+import codecs
+
+#(separator, encoding, engine, mode) combinations used to read a SWAT+ file, in the order they are tried
+_READ_STRATEGIES = [
+    (r'\s+', 'utf-8', 'c', 'dask'),
+    (r'\s+', 'latin-1', 'c', 'dask'),
+    (r"[ ]{2,}", 'utf-8', 'python', 'dask'),
+    (r"[ ]{2,}", 'latin-1', 'python', 'dask'),
+    (r'\s+', 'utf-8', 'c', 'pandas'),
+    (r'\s+', 'latin-1', 'c', 'pandas'),
+    (r"[ ]{2,}", 'utf-8', 'python', 'pandas'),
+    (r"[ ]{2,}", 'latin-1', 'python', 'pandas'),
+]
+
+#number of bytes at the beginning of a file that are inspected to guess its format
+_SNIFF_BYTES = 4096
 
 def read_csv(
         path: Union[str, Path], 
@@ -49,16 +65,6 @@ def read_csv(
             encoding=encoding,
             engine=engine
         )
-        
-        for column, keys in filter_by.items():
-            #check if keys is a list or a str
-            if isinstance(keys, list):
-                df = df.loc[df[column].isin(keys)]
-            else:
-                df = df.loc[df[column] == keys]
-        
-
-        return df.compute()
     
     elif mode == 'pandas':
         df = pd.read_csv(
@@ -70,14 +76,65 @@ def read_csv(
             engine=engine
         )
 
-        for column, keys in filter_by.items():
-            #check if keys is a list or a str
-            if isinstance(keys, list):
-                df = df.loc[df[column].isin(keys)]
-            else:
-                df = df.loc[df[column] == keys]
+    else:
+        raise ValueError("mode must be 'dask' or 'pandas'")
+
+    #combine all filters in a single mask so the rows are only selected once
+    mask = None
+    for column, keys in filter_by.items():
+        #check if keys is a list or a str
+        if isinstance(keys, list):
+            column_mask = df[column].isin(keys)
+        else:
+            column_mask = df[column] == keys
+        mask = column_mask if mask is None else mask & column_mask
+
+    if mask is not None:
+        df = df.loc[mask]
+
+    if mode == 'dask':
+        return df.compute()
+
+    return df
+
+
+def _sniff_format(head: bytes, skip_rows: List[int]) -> Tuple[str, str]:
+
+    '''
+    Guess the separator and encoding of a SWAT+ file by inspecting its first bytes.
+
+        Parameters:
+        head (bytes): The first _SNIFF_BYTES bytes of the file (or the whole file, if it is shorter).
+        skip_rows (List[int]): List of specific row numbers that are not part of the table.
+
+        Returns:
+        Tuple[str, str]: The separator and the encoding that are most likely to parse the file.
+    '''
+
+    #the head may end in the middle of a multibyte character, so it is decoded incrementally
+    try:
+        text = codecs.getincrementaldecoder('utf-8')().decode(head)
+        encoding = 'utf-8'
+    except UnicodeDecodeError:
+        text = head.decode('latin-1')
+        encoding = 'latin-1'
 
-        return df
+    lines = [line for line_number, line in enumerate(text.splitlines()) if line_number not in skip_rows]
+
+    #the last line may be cut if the file is longer than the head
+    if len(head) == _SNIFF_BYTES:
+        lines = lines[:-1]
+
+    if len(lines) < 2:
+        return r'\s+', encoding
+
+    #values containing single spaces split into more fields than the header, which makes the whitespace separator fail
+    n_columns = len(lines[0].split())
+    fields_per_line = {len(line.split()) for line in lines[1:] if line.strip()}
+    if len(fields_per_line) > 1 and max(fields_per_line) > n_columns:
+        return r"[ ]{2,}", encoding
+
+    return r'\s+', encoding
 
 
 class FileReader:
@@ -109,7 +166,7 @@ class FileReader:
 
         Note:
         - When has_units is True, the file is expected to have units information, and the units_file attribute will be set.
-        - The read_csv method is called with different parameters to attempt reading the file with various delimiters and encodings.
+        - The delimiter and encoding are sniffed from the beginning of the file and tried first. If reading fails, the read_csv method is called with the remaining delimiters and encodings.
         - If an index column is specified, it will be used as the index in the DataFrame.
 
         Example:
@@ -136,52 +193,39 @@ class FileReader:
             raise TypeError("Not implemented yet")
 
         else:
-            #read only first line of file    
-            with open(path, 'r', encoding='latin-1') as file:
-                # Read the first line
-                self.header_file = file.readline()
-                        
-            if has_units:
-                #read only third line of file
-                with open(path, 'r', encoding='latin-1') as file:
-                    # Use a for loop to iterate through the file, reading lines
-                    for line_number, line in enumerate(file, start=1):
-                        if line_number == 3:
-                            self.units_file = line
-                            break
+            #read the first line of file, the third one if it has units, and the head used to sniff the format, opening the file only once
+            with open(path, 'rb') as file:
+                #lines are decoded as latin-1 with windows line endings normalized, as the text mode read did
+                self.header_file = file.readline().decode('latin-1').replace('\r\n', '\n')
+
+                if has_units:
+                    #skip the column names and read the units
+                    file.readline()
+                    units_line = file.readline()
+                    if units_line:
+                        self.units_file = units_line.decode('latin-1').replace('\r\n', '\n')
+
+                file.seek(0)
+                head = file.read(_SNIFF_BYTES)
 
 
 
             with warnings.catch_warnings(record=True) as w:
                 warnings.simplefilter("error")
 
-                #first try with dask. if it fails, try with pandas
-                try:
-                    df = read_csv(path, skip_rows, usecols, filter_by, '\s+', 'utf-8', 'c', 'dask')
-                except:
+                #try the sniffed format first, and fall back to the remaining combinations only if it fails
+                sniffed = _sniff_format(head, skip_rows)
+                #all dask combinations are still tried before any pandas one, the sniffed format goes first within each mode
+                strategies = sorted(_READ_STRATEGIES, key = lambda strategy: (strategy[3] != 'dask', strategy[:2] != sniffed))
+
+                for separator, encoding, engine, mode in strategies:
                     try:
-                        df = read_csv(path, skip_rows, usecols, filter_by, '\s+', 'latin-1', 'c', 'dask')
-                    except:
-                        try:
-                            df = read_csv(path, skip_rows, usecols, filter_by, r"[ ]{2,}", 'utf-8', 'python', 'dask')
-                        except:
-                            try:
-                                df = read_csv(path, skip_rows, usecols, filter_by, r"[ ]{2,}", 'latin-1', 'python', 'dask')
-                            except:    
-                                try:
-                                    df = read_csv(path, skip_rows, usecols, filter_by, '\s+', 'utf-8', 'c', 'pandas')
-                                except:
-                                    try:
-                                        df = read_csv(path, skip_rows, usecols, filter_by, '\s+', 'latin-1', 'c', 'pandas')
-                                    except:
-                                        try:
-                                            df = read_csv(path, skip_rows, usecols, filter_by, r"[ ]{2,}", 'utf-8', 'python', 'pandas')
-                                        except:
-                                            try:
-                                                df = read_csv(path, skip_rows, usecols, filter_by, r"[ ]{2,}", 'latin-1', 'python', 'pandas')
-
-                                            except Exception as e:
-                                                raise e
+                        df = read_csv(path, skip_rows, usecols, filter_by, separator, encoding, engine, mode)
+                        break
+                    except Exception as e:
+                        error = e
+                else:
+                    raise error
 
                 
 
@@ -189,7 +233,9 @@ class FileReader:
         if not isinstance(df, pd.DataFrame):
             raise TypeError("Something went wrong!")
         
-        df.columns = df.columns.str.replace(' ', '')
+        #only rebuild the column index when a header actually contains spaces
+        if any(' ' in column for column in df.columns):
+            df.columns = df.columns.str.replace(' ', '')
 
         if index is not None:
             aux_index_name = 'aux_index'
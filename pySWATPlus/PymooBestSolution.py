@@ -3,6 +3,7 @@ import multiprocessing
 import numpy as np
 import itertools
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple
 
 this = sys.modules[__name__]
@@ -32,13 +33,17 @@ def add_solutions(X, paths_array: List[Dict[str, str]], errors_array: np.ndarray
 
     add_solution(x, path, error)
 
-    best = this.path.values()
+    #set of the best paths, so that each membership test below is a hash lookup
+    best = set(this.path.values())
     all_paths = itertools.chain.from_iterable((map(lambda x: x.values(), paths_array)))
 
-    
-    for i in all_paths:
-        if i not in best and i is not None:
-            shutil.rmtree(i)
+    #each path only once, so that two threads never remove the same folder
+    to_delete = list(dict.fromkeys(i for i in all_paths if i not in best and i is not None))
+
+    #removing folders is dominated by filesystem calls, which release the GIL, so they can overlap
+    if to_delete:
+        with ThreadPoolExecutor() as executor:
+            list(executor.map(shutil.rmtree, to_delete))
 
 
 def add_solution(X: np.ndarray, path: Dict[str, str], error: float) -> None:
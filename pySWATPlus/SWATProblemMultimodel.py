@@ -93,11 +93,16 @@ class SWATProblemMultimodel(Problem):
         """
         
         
+        if parallelization not in ('threads', 'processes'):
+            raise ValueError("parallelization must be 'threads' or 'processes'")
+
         lb = []
         ub = []
+        params_layout = []    #[(filename, id_col, [(id, col)])], in the same order as the bounds
         
         #build upper and lower bounds
-        for _, params_file in list(params.values()):
+        for filename, (id_col, params_file) in params.items():
+            params_layout.append((filename, id_col, [(x[0], x[1]) for x in params_file]))
             for x in params_file:
                 lb.append(x[2])
                 ub.append(x[3])
@@ -118,6 +123,7 @@ class SWATProblemMultimodel(Problem):
         self.n_workers = n_workers
         self.parallelization = parallelization
         self.params = params
+        self.params_layout = params_layout
         self.kwargs = kwargs
         self.param_arg_name = param_arg_name
         self.function_to_evaluate_prior = function_to_evaluate_prior
@@ -159,23 +165,19 @@ class SWATProblemMultimodel(Problem):
             if self.function_to_evaluate_prior is not None:
                 return_function_prior = self.function_to_evaluate_prior(X = X_prior, **self.args_function_to_evaluate_prior)
 
-            _id = 0
-            new_params = {}     #in the end will be {filename: (id_col, [(id, col, value)])}
-            params = self.params    #{filename: (id_col, [(id, col, lb, ub)])}
-
-            for file in params.keys():
-                index, params_tuple = params[file]
-                new_params[file] = (index, [])
-                for param in params_tuple:
-                    new_params[file][1].append((param[0], param[1], X_swat[_id]))
-                    _id += 1
+            #{filename: (id_col, [(id, col, value)])}, values are taken in the same order as the bounds
+            values = iter(X_swat)
+            new_params = {filename: (id_col, [(id, col, next(values)) for id, col in targets])
+                          for filename, id_col, targets in self.params_layout}
 
-            self.kwargs[self.param_arg_name] = new_params
+            #each simulation gets its own copy of the user arguments, self.kwargs is left untouched
+            kwargs = copy.deepcopy(self.kwargs)
+            kwargs[self.param_arg_name] = new_params
 
             if self.param_arg_name_to_modificate_by_prior_function is not None:
-                self.kwargs[self.param_arg_name_to_modificate_by_prior_function] = return_function_prior
+                kwargs[self.param_arg_name_to_modificate_by_prior_function] = return_function_prior
             
-            args_array.append(copy.deepcopy(self.kwargs))
+            args_array.append(kwargs)
         
         if self.debug:
             print('begin running simulations')
@@ -187,8 +189,6 @@ class SWATProblemMultimodel(Problem):
         elif self.parallelization == 'processes':
             with multiprocessing.Pool(self.n_workers) as pool:
                 F = list(pool.map(self.function_to_evaluate, args_array))
-        else:
-            raise ValueError("parallelization must be 'threads' or 'processes'")  
         
         if self.debug:
             print('simulations done')
@@ -202,15 +202,18 @@ class SWATProblemMultimodel(Problem):
         if self.debug:
             print(errors_array)
 
-        #replace nan error by 1e10 (infinity)
-        errors_array[np.isnan(errors_array)] = 1e10
+        #single pass to find nan errors, reused for the message and the replacement
+        nan_errors = np.isnan(errors_array)
 
         #check if nans and print message
-        if np.isnan(errors_array).any() and self.debug:
+        if self.debug and nan_errors.any():
             print('ERROR: some errors are nan')
             print(errors_array)
             print(paths_array)
 
+        #replace nan error by 1e10 (infinity)
+        errors_array[nan_errors] = 1e10
+
         if self.debug:
             print('adding solutions')
 
@@ -10,6 +10,9 @@ import datetime
 from typing import List, Dict, Tuple, Optional
 from concurrent.futures import ThreadPoolExecutor
 
+#suffixes of SWAT+ output files, which are not copied by copy_swat
+_OUTPUT_SUFFIXES = ('_aa.txt', '_aa.csv', '_yr.txt', '_yr.csv', '_day.txt', '_day.csv', '_mon.csv', '_mon.txt')
+
 class TxtinoutReader:
 
     def __init__(self, path: str) -> None:
@@ -40,16 +43,17 @@ class TxtinoutReader:
         if not path.is_dir():
             raise FileNotFoundError("folder does not exist")
             
-        #count files that end with .exe
+        #count files that end with .exe, scandir entries already know their type so no extra stat is needed
         count = 0
         swat_exe = None
-        for file in os.listdir(path):
-            if file.endswith(".exe"):
-                if count == 0:
-                    swat_exe = file
-                elif count > 0:
-                    raise TypeError("More than one .exe file found in the parent folder")
-                count += 1
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.name.endswith(".exe") and entry.is_file():
+                    if count == 0:
+                        swat_exe = entry.name
+                    elif count > 0:
+                        raise TypeError("More than one .exe file found in the parent folder")
+                    count += 1
 
         if count == 0:
             raise TypeError(".exe not found in parent folder")
@@ -73,25 +77,8 @@ class TxtinoutReader:
         Returns:
         str: A formatted string representing the line to add to the 'print.prt' file.
         """
-        print_periodicity = {
-            'daily': daily,
-            'monthly': monthly,
-            'yearly': yearly,
-            'avann': avann,
-        }
-
-        arg_to_add = obj.ljust(29)
-        for value in print_periodicity.values():
-            if value:
-                periodicity = 'y'
-            else: 
-                periodicity = 'n'
-                
-            arg_to_add += periodicity.ljust(14)
-
-        arg_to_add = arg_to_add.rstrip()
-        arg_to_add += '\n'
-        return arg_to_add
+        periodicity = ''.join(('y' if value else 'n').ljust(14) for value in (daily, monthly, yearly, avann))
+        return obj.ljust(29) + periodicity.rstrip() + '\n'
 
     
     def enable_object_in_print_prt(self, obj: str, daily: bool, monthly: bool, yearly: bool, avann: bool) -> None:
@@ -117,24 +104,24 @@ class TxtinoutReader:
         
         #read all print_prt file, line by line
         print_prt_path = self.root_folder / 'print.prt'
-        new_print_prt = ""
+        new_print_prt = []     #lines are joined once when writing, instead of growing a string line by line
         found = False
         with open(print_prt_path) as file:
             for line in file:
                 if not line.startswith(arg_to_add + ' '): #Line must start exactly with arg_to_add, not a word that starts with arg_to_add 
-                    new_print_prt += line
+                    new_print_prt.append(line)
                 else:
                     #obj already exist, replace it in same position
-                    new_print_prt += self._build_line_to_add(arg_to_add, daily, monthly, yearly, avann)
+                    new_print_prt.append(self._build_line_to_add(arg_to_add, daily, monthly, yearly, avann))
                     found = True
 
         if not found:
-            new_print_prt += self._build_line_to_add(arg_to_add, daily, monthly, yearly, avann)
+            new_print_prt.append(self._build_line_to_add(arg_to_add, daily, monthly, yearly, avann))
 
 
         #store new print_prt
         with open(print_prt_path, 'w') as file:
-            file.write(new_print_prt)
+            file.write(''.join(new_print_prt))
         
     #modify yrc_start and yrc_end
     def set_beginning_and_end_year(self, beginning: int, end: int) -> None:
@@ -315,14 +302,14 @@ class TxtinoutReader:
             
                 temp_folder_path = dir
                 
-                #delete all files in dir
-                for file in os.listdir(dir):
-                    file_path = os.path.join(dir, file)
-                    try:
-                        if os.path.isfile(file_path):
-                            os.remove(file_path)
-                    except Exception as e:
-                        print(e)
+                #delete all files in dir, scandir entries already know their type so no extra stat is needed
+                with os.scandir(dir) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_file():
+                                os.remove(entry.path)
+                        except Exception as e:
+                            print(e)
             
             else:   #if overwrite and dir is not a folder, create dir anyway
                 os.makedirs(dir, exist_ok=True)
@@ -347,7 +334,7 @@ class TxtinoutReader:
 
         # Exclude files with the specified suffix and copy the remaining files
         for file in files:
-            if not file.endswith('_aa.txt') and not file.endswith('_aa.csv') and not file.endswith('_yr.txt') and not file.endswith('_yr.csv') and not file.endswith('_day.txt') and not file.endswith('_day.csv') and not file.endswith('_mon.csv') and not file.endswith('_mon.txt'):
+            if not file.endswith(_OUTPUT_SUFFIXES):
                 source_file = os.path.join(source_folder, file)
                 destination_file = os.path.join(temp_folder_path, file)
 
@@ -411,15 +398,13 @@ class TxtinoutReader:
         str: The path to the directory where the SWAT simulation was executed.
         """
 
-        aux_txtinout = TxtinoutReader(self.root_folder)
-
         #Modify files for simulation
         for filename, file_params in params.items():
 
             id_col, file_mods = file_params
 
             #get file
-            file = aux_txtinout.register_file(filename, has_units = False, index = id_col)
+            file = self.register_file(filename, has_units = False, index = id_col)
 
             #for each col_name in file_params
             for id, col_name, value in file_mods:   #if id is not given, value will be applied to all rows
@@ -435,7 +420,7 @@ class TxtinoutReader:
         
         #run simulation
         #print(f'Simulation started at {beginning.strftime("%H:%M:%S")}. Stored at {str(self.root_folder)}.')
-        aux_txtinout._run_swat(show_output=show_output)
+        self._run_swat(show_output=show_output)
         end = datetime.datetime.now()
         td = end - beginning
 